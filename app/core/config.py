@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,9 +8,15 @@ class Settings(BaseSettings):
     debug: bool = False
     
     # Pydantic v2: use SettingsConfigDict instead of inner Config class
-    model_config = SettingsConfigDict(env_file=".env")
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide Settings, parsing env/.env only once."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
 
 
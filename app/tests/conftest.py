@@ -1,11 +1,23 @@
+from collections.abc import Iterator
+
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.utils.font_cache import FontCache
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
-def client() -> TestClient:
-    return TestClient(app)
+def font_cache(monkeypatch: pytest.MonkeyPatch) -> FontCache:
+    """Give each test its own FontCache in place of the global one."""
+    cache = FontCache()
+    monkeypatch.setattr("app.services.text_render_service.get_font_cache", lambda: cache)
+    return cache
 
 
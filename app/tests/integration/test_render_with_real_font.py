@@ -6,7 +6,7 @@ import pytest
 from PIL import Image
 
 from app.services.text_render_service import _download_font, render_text
-from app.utils.font_cache import get_font_cache
+from app.utils.font_cache import FontCache
 
 
 # Real font URLs for testing
@@ -17,14 +17,10 @@ TEST_FONT_URL = (
 )
 
 
+@pytest.mark.usefixtures("font_cache")
 class TestRealFontDownload:
     """Integration tests with real font URLs."""
     
-    def setup_method(self) -> None:
-        """Clear font cache before each test."""
-        cache = get_font_cache()
-        cache._cache.clear()
-    
     @pytest.mark.integration
     def test_download_real_font_moresugar(self) -> None:
         """Test downloading a real OTF font from Canva CDN."""
@@ -42,16 +38,15 @@ class TestRealFontDownload:
         assert font_data[:4] == b'OTTO', "Font should have OTF signature"
     
     @pytest.mark.integration
-    def test_real_font_caching_works(self) -> None:
+    def test_real_font_caching_works(self, font_cache: FontCache) -> None:
         """Verify that real font is cached after first download."""
         font_url = TEST_FONT_URL
-        cache = get_font_cache()
         
         # First download
         font_data_1 = _download_font(font_url)
         
         # Verify it's in cache
-        cached_data = cache.get_font(font_url)
+        cached_data = font_cache.get_font(font_url)
         assert cached_data is not None
         assert cached_data == font_data_1
         
@@ -71,14 +66,10 @@ class TestRealFontDownload:
             _download_font(invalid_url)
 
 
+@pytest.mark.usefixtures("font_cache")
 class TestRenderTextIntegration:
     """End-to-end integration tests for render_text function."""
     
-    def setup_method(self) -> None:
-        """Clear font cache before each test."""
-        cache = get_font_cache()
-        cache._cache.clear()
-    
     @pytest.mark.integration
     def test_render_with_google_fonts(self) -> None:
         """Test end-to-end rendering with real font from CDN."""
@@ -224,9 +215,8 @@ class TestRenderTextIntegration:
             assert image.height > 0
     
     @pytest.mark.integration
-    def test_font_caching_works(self) -> None:
+    def test_font_caching_works(self, font_cache: FontCache) -> None:
         """Verify font caching works across multiple render_text calls."""
-        cache = get_font_cache()
         
         # First render - should download font
         image_bytes_1 = render_text(
@@ -237,7 +227,7 @@ class TestRenderTextIntegration:
         )
         
         # Verify font is cached
-        cached_font = cache.get_font(TEST_FONT_URL)
+        cached_font = font_cache.get_font(TEST_FONT_URL)
         assert cached_font is not None
         
         # Second render - should use cached font
@@ -253,5 +243,5 @@ class TestRenderTextIntegration:
         assert image_bytes_2[:8] == b'\x89PNG\r\n\x1a\n'
         
         # Verify cache still has the same font
-        cached_font_after = cache.get_font(TEST_FONT_URL)
+        cached_font_after = font_cache.get_font(TEST_FONT_URL)
         assert cached_font_after is cached_font  # Same object reference
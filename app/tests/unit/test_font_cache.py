@@ -1,5 +1,10 @@
 """Unit tests for font cache utility."""
 
+import sys
+import threading
+
+import pytest
+
 from app.utils.font_cache import FontCache
 
 
@@ -77,3 +82,90 @@ class TestFontCache:
         cache.set_font(url, font_data2)
         assert cache.get_font(url) == font_data2
 
+    
+    def test_lru_eviction(self) -> None:
+        """Verify the least recently used font is evicted when full."""
+        cache = FontCache(max_entries=2)
+        url1 = "https://example.com/font1.otf"
+        url2 = "https://example.com/font2.otf"
+        url3 = "https://example.com/font3.otf"
+        
+        cache.set_font(url1, b"font data 1")
+        cache.set_font(url2, b"font data 2")
+        
+        # Touch url1 so url2 becomes least recently used
+        assert cache.get_font(url1) == b"font data 1"
+        
+        cache.set_font(url3, b"font data 3")
+        
+        assert cache.get_font(url1) == b"font data 1"
+        assert cache.get_font(url2) is None
+        assert cache.get_font(url3) == b"font data 3"
+    
+    def test_invalid_max_entries_raises(self) -> None:
+        """Verify a non-positive max_entries is rejected."""
+        with pytest.raises(ValueError, match="max_entries must be positive"):
+            FontCache(max_entries=0)
+    
+    def test_identical_fonts_share_storage(self) -> None:
+        """Verify identical font data under different URLs is stored once."""
+        cache = FontCache()
+        url1 = "https://cdn-a.example.com/font.otf"
+        url2 = "https://cdn-b.example.com/font.otf?v=2"
+        
+        cache.set_font(url1, b"same font data")
+        cache.set_font(url2, bytes(bytearray(b"same font data")))
+        
+        assert cache.get_font(url1) is cache.get_font(url2)
+        
+        # Shared data survives until the last URL referencing it is removed
+        cache.clear_font(url1)
+        assert cache.get_font(url2) == b"same font data"
+        
+        cache.clear_font(url2)
+        assert cache.get_font(url1) is None
+        assert cache.get_font(url2) is None
+        
+        # Once released, the same data can be cached again
+        cache.set_font(url1, b"same font data")
+        assert cache.get_font(url1) == b"same font data"
+    
+    def test_concurrent_access_from_threads(self) -> None:
+        """Verify a small shared cache stays consistent under many threads."""
+        cache = FontCache(max_entries=2)
+        urls = [f"https://example.com/font{i}.otf" for i in range(6)]
+        errors: list[BaseException] = []
+        
+        def worker(offset: int) -> None:
+            try:
+                for i in range(2000):
+                    url = urls[(i + offset) % len(urls)]
+                    # Half the URLs share the same data to exercise refcounts
+                    font_data = b"shared font data" if i % 2 else url.encode()
+                    cache.set_font(url, font_data)
+                    retrieved = cache.get_font(url)
+                    assert retrieved is None or retrieved in (b"shared font data", url.encode())
+                    if i % 3 == 0:
+                        cache.clear_font(urls[(i + offset + 1) % len(urls)])
+            except BaseException as e:  # noqa: BLE001 - surfaced below
+                errors.append(e)
+        
+        # Switch threads as often as possible to force interleaving
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        
+        assert errors == []
+        
+        # Cache is still bounded and usable afterwards
+        cached = [url for url in urls if cache.get_font(url) is not None]
+        assert len(cached) <= 2
+        cache.set_font(urls[0], b"final font data")
+        assert cache.get_font(urls[0]) == b"final font data"
@@ -13,114 +13,115 @@ from app.services.text_render_service import (
     _download_font,
     render_text,
 )
-from app.utils.font_cache import get_font_cache
+from app.utils.font_cache import FontCache
 
 
+@pytest.fixture(scope="module")
+def shared_font_mock() -> MagicMock:
+    """Build the spec'd FreeTypeFont mock once per module."""
+    return MagicMock(spec=ImageFont.FreeTypeFont)
+
+
+@pytest.fixture
+def mock_font(shared_font_mock: MagicMock) -> MagicMock:
+    """Provide the shared font mock with calls and configured returns reset."""
+    shared_font_mock.reset_mock(return_value=True, side_effect=True)
+    return shared_font_mock
+
+
+@pytest.mark.usefixtures("font_cache")
 class TestDownloadFont:
     """Test suite for font download functionality."""
     
-    def setup_method(self) -> None:
-        """Clear font cache before each test."""
-        cache = get_font_cache()
-        cache._cache.clear()
+    @pytest.fixture(autouse=True)
+    def mock_get(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Replace requests.get in the service module for every test."""
+        mock_get = MagicMock()
+        monkeypatch.setattr("app.services.text_render_service.requests.get", mock_get)
+        return mock_get
     
-    def test_download_font_success(self) -> None:
+    def test_download_font_success(self, mock_get: MagicMock) -> None:
         """Verify font bytes are returned on successful download."""
         mock_font_data = b"fake font data"
         
-        with patch("app.services.text_render_service.requests.get") as mock_get:
-            # Mock successful response
-            mock_response = MagicMock()
-            mock_response.content = mock_font_data
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
-            
-            result = _download_font("https://example.com/font.otf")
-            
-            assert result == mock_font_data
-            mock_get.assert_called_once_with("https://example.com/font.otf", timeout=30)
-            mock_response.raise_for_status.assert_called_once()
+        # Mock successful response
+        mock_response = MagicMock()
+        mock_response.content = mock_font_data
+        mock_response.raise_for_status = MagicMock()
+        mock_get.return_value = mock_response
+        
+        result = _download_font("https://example.com/font.otf")
+        
+        assert result == mock_font_data
+        mock_get.assert_called_once_with("https://example.com/font.otf", timeout=30)
+        mock_response.raise_for_status.assert_called_once()
     
-    def test_download_font_404(self) -> None:
+    def test_download_font_404(self, mock_get: MagicMock) -> None:
         """Verify HTTPError is raised for 404 status code."""
-        with patch("app.services.text_render_service.requests.get") as mock_get:
-            # Mock 404 response
-            mock_response = MagicMock()
-            mock_response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
-            mock_get.return_value = mock_response
-            
-            with pytest.raises(requests.HTTPError, match="404 Not Found"):
-                _download_font("https://example.com/nonexistent.otf")
+        # Mock 404 response
+        mock_response = MagicMock()
+        mock_response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
+        mock_get.return_value = mock_response
+        
+        with pytest.raises(requests.HTTPError, match="404 Not Found"):
+            _download_font("https://example.com/nonexistent.otf")
     
-    def test_download_font_timeout(self) -> None:
+    def test_download_font_timeout(self, mock_get: MagicMock) -> None:
         """Verify timeout error is properly raised."""
-        with patch("app.services.text_render_service.requests.get") as mock_get:
-            # Mock timeout
-            mock_get.side_effect = requests.Timeout("Request timed out")
-            
-            with pytest.raises(requests.Timeout, match="Request timed out"):
-                _download_font("https://example.com/slow-font.otf")
-            
-            mock_get.assert_called_once_with("https://example.com/slow-font.otf", timeout=30)
+        # Mock timeout
+        mock_get.side_effect = requests.Timeout("Request timed out")
+        
+        with pytest.raises(requests.Timeout, match="Request timed out"):
+            _download_font("https://example.com/slow-font.otf")
+        
+        mock_get.assert_called_once_with("https://example.com/slow-font.otf", timeout=30)
     
-    def test_download_font_uses_cache(self) -> None:
+    def test_download_font_uses_cache(
+        self, mock_get: MagicMock, font_cache: FontCache
+    ) -> None:
         """Verify cache hit avoids making HTTP request."""
-        cache = get_font_cache()
         font_url = "https://example.com/cached-font.otf"
         cached_data = b"cached font data"
         
         # Pre-populate cache
-        cache.set_font(font_url, cached_data)
+        font_cache.set_font(font_url, cached_data)
         
-        with patch("app.services.text_render_service.requests.get") as mock_get:
-            result = _download_font(font_url)
-            
-            # Should return cached data without making HTTP request
-            assert result == cached_data
-            mock_get.assert_not_called()
+        result = _download_font(font_url)
+        
+        # Should return cached data without making HTTP request
+        assert result == cached_data
+        mock_get.assert_not_called()
     
-    def test_download_font_stores_in_cache(self) -> None:
+    def test_download_font_stores_in_cache(
+        self, mock_get: MagicMock, font_cache: FontCache
+    ) -> None:
         """Verify downloaded font is stored in cache."""
-        cache = get_font_cache()
         font_url = "https://example.com/new-font.otf"
         mock_font_data = b"new font data"
         
-        with patch("app.services.text_render_service.requests.get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.content = mock_font_data
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
-            
-            _download_font(font_url)
-            
-            # Verify font is now in cache
-            assert cache.get_font(font_url) == mock_font_data
+        mock_response = MagicMock()
+        mock_response.content = mock_font_data
+        mock_response.raise_for_status = MagicMock()
+        mock_get.return_value = mock_response
+        
+        _download_font(font_url)
+        
+        # Verify font is now in cache
+        assert font_cache.get_font(font_url) == mock_font_data
     
-    def test_download_font_network_error(self) -> None:
+    def test_download_font_network_error(self, mock_get: MagicMock) -> None:
         """Verify network errors are properly raised."""
-        with patch("app.services.text_render_service.requests.get") as mock_get:
-            mock_get.side_effect = requests.RequestException("Network error")
-            
-            with pytest.raises(requests.RequestException, match="Network error"):
-                _download_font("https://example.com/font.otf")
+        mock_get.side_effect = requests.RequestException("Network error")
+        
+        with pytest.raises(requests.RequestException, match="Network error"):
+            _download_font("https://example.com/font.otf")
 
 
 class TestImageRendering:
     """Test suite for image rendering functionality."""
     
-    @pytest.fixture
-    def mock_font(self) -> ImageFont.FreeTypeFont:
-        """Create a mock font for testing."""
-        # Use a simple default font for testing
-        # Create a font that returns predictable textbbox values
-        mock_font = MagicMock(spec=ImageFont.FreeTypeFont)
-        return mock_font
-    
-    def test_calculate_dimensions(self) -> None:
+    def test_calculate_dimensions(self, mock_font: MagicMock) -> None:
         """Verify correct width/height calculation with padding."""
-        # Create a mock font that returns predictable textbbox
-        mock_font = MagicMock(spec=ImageFont.FreeTypeFont)
-        
         with patch("app.services.text_render_service.ImageDraw.Draw") as mock_draw_class:
             mock_draw = MagicMock()
             # Mock textbbox to return (left, top, right, bottom)
@@ -137,10 +138,8 @@ class TestImageRendering:
             # Verify textbbox was called with correct parameters
             mock_draw.textbbox.assert_called_once_with((0, 0), "Test", font=mock_font)
     
-    def test_create_image_returns_pil_image(self) -> None:
+    def test_create_image_returns_pil_image(self, mock_font: MagicMock) -> None:
         """Verify Image object is returned."""
-        mock_font = MagicMock(spec=ImageFont.FreeTypeFont)
-        
         with patch("app.services.text_render_service.ImageDraw.Draw") as mock_draw_class:
             mock_draw = MagicMock()
             # Mock textbbox for text positioning
@@ -152,10 +151,8 @@ class TestImageRendering:
             # Verify it returns a PIL Image
             assert isinstance(result, Image.Image)
     
-    def test_image_has_white_background(self) -> None:
+    def test_image_has_white_background(self, mock_font: MagicMock) -> None:
         """Verify RGB white background is used."""
-        mock_font = MagicMock(spec=ImageFont.FreeTypeFont)
-        
         with patch("app.services.text_render_service.ImageDraw.Draw") as mock_draw_class:
             mock_draw = MagicMock()
             mock_draw.textbbox.return_value = (0, 0, 50, 20)
@@ -174,10 +171,8 @@ class TestImageRendering:
             pixel = image.getpixel((0, 0))
             assert pixel == (255, 255, 255), f"Expected white background, got {pixel}"
     
-    def test_text_is_centered(self) -> None:
+    def test_text_is_centered(self, mock_font: MagicMock) -> None:
         """Verify text position calculation centers the text."""
-        mock_font = MagicMock(spec=ImageFont.FreeTypeFont)
-        
         with patch("app.services.text_render_service.ImageDraw.Draw") as mock_draw_class:
             mock_draw = MagicMock()
             # Simulate text that is 60x30 pixels
@@ -203,15 +198,11 @@ class TestImageRendering:
             assert call_args[1]["fill"] == 'black'  # Text color
 
 
+@pytest.mark.usefixtures("font_cache")
 class TestRenderText:
     """Test suite for main render_text function."""
     
-    def setup_method(self) -> None:
-        """Clear font cache before each test."""
-        cache = get_font_cache()
-        cache._cache.clear()
-    
-    def test_render_text_success(self) -> None:
+    def test_render_text_success(self, mock_font: MagicMock) -> None:
         """Verify PNG bytes are returned on successful render."""
         mock_font_data = b"fake font data"
         font_url = "https://example.com/font.otf"
@@ -228,7 +219,6 @@ class TestRenderText:
             mock_get.return_value = mock_response
             
             # Mock font loading
-            mock_font = MagicMock(spec=ImageFont.FreeTypeFont)
             mock_truetype.return_value = mock_font
             
             # Mock dimension calculation
@@ -253,34 +243,28 @@ class TestRenderText:
             mock_calc.assert_called_once_with("Test", mock_font, 10)
             mock_create.assert_called_once_with(200, 100, "Test", mock_font, 10)
     
-    def test_render_text_empty_text_raises(self) -> None:
-        """Verify ValueError is raised for empty text."""
-        with pytest.raises(ValueError, match="Text cannot be empty"):
-            render_text("https://example.com/font.otf", "", 24.0, 10)
-        
-        # Also test whitespace-only text
-        with pytest.raises(ValueError, match="Text cannot be empty"):
-            render_text("https://example.com/font.otf", "   ", 24.0, 10)
-    
-    def test_render_text_negative_font_size_raises(self) -> None:
-        """Verify ValueError is raised for negative font size."""
-        with pytest.raises(ValueError, match="Font size must be positive"):
-            render_text("https://example.com/font.otf", "Test", -24.0, 10)
-        
-        # Also test zero font size
-        with pytest.raises(ValueError, match="Font size must be positive"):
-            render_text("https://example.com/font.otf", "Test", 0, 10)
-    
-    def test_render_text_negative_padding_raises(self) -> None:
-        """Verify ValueError is raised for negative padding."""
-        with pytest.raises(ValueError, match="Padding cannot be negative"):
-            render_text("https://example.com/font.otf", "Test", 24.0, -10)
+    @pytest.mark.parametrize(
+        "text,font_size,padding,match",
+        [
+            ("", 24.0, 10, "Text cannot be empty"),
+            ("   ", 24.0, 10, "Text cannot be empty"),
+            ("Test", -24.0, 10, "Font size must be positive"),
+            ("Test", 0, 10, "Font size must be positive"),
+            ("Test", 24.0, -10, "Padding cannot be negative"),
+        ],
+        ids=["empty-text", "whitespace-text", "negative-font-size", "zero-font-size", "negative-padding"],
+    )
+    def test_render_text_invalid_arguments_raise(
+        self, text: str, font_size: float, padding: int, match: str
+    ) -> None:
+        """Verify ValueError is raised for each invalid argument."""
+        with pytest.raises(ValueError, match=match):
+            render_text("https://example.com/font.otf", text, font_size, padding)
     
-    def test_render_text_invalid_font_raises(self) -> None:
+    def test_render_text_invalid_font_raises(self, font_cache: FontCache) -> None:
         """Verify IOError is raised for invalid font and cache is cleared."""
         mock_font_data = b"invalid font data"
         font_url = "https://example.com/invalid-font.otf"
-        cache = get_font_cache()
         
         with patch("app.services.text_render_service.requests.get") as mock_get, \
              patch("app.services.text_render_service.ImageFont.truetype") as mock_truetype:
@@ -299,9 +283,11 @@ class TestRenderText:
                 render_text(font_url, "Test", 24.0, 10)
             
             # Verify cache was cleared
-            assert cache.get_font(font_url) is None
+            assert font_cache.get_font(font_url) is None
     
-    def test_render_text_unicode_support(self) -> None:
+    def test_render_text_unicode_support(
+        self, mock_font: MagicMock, font_cache: FontCache
+    ) -> None:
         """Verify emoji and CJK characters are handled correctly."""
         mock_font_data = b"fake font data"
         font_url = "https://example.com/font.otf"
@@ -319,7 +305,6 @@ class TestRenderText:
             mock_get.return_value = mock_response
             
             # Mock font loading
-            mock_font = MagicMock(spec=ImageFont.FreeTypeFont)
             mock_truetype.return_value = mock_font
             
             # Mock dimension calculation
@@ -338,8 +323,7 @@ class TestRenderText:
             mock_create.assert_called_with(200, 100, emoji_text, mock_font, 10)
         
         # Clear cache for next test
-        cache = get_font_cache()
-        cache._cache.clear()
+        font_cache.clear_font(font_url)
         
         # Test with CJK characters
         with patch("app.services.text_render_service.requests.get") as mock_get, \
@@ -354,7 +338,6 @@ class TestRenderText:
             mock_get.return_value = mock_response
             
             # Mock font loading
-            mock_font = MagicMock(spec=ImageFont.FreeTypeFont)
             mock_truetype.return_value = mock_font
             
             # Mock dimension calculation
@@ -1,52 +1,125 @@
 """Font cache utility for storing downloaded fonts in memory.
 
 This module provides a simple in-memory cache for font data to avoid
-redundant downloads within the same session.
+redundant downloads within the same session. The cache is bounded and
+evicts the least recently used font once it holds ``max_entries`` fonts.
+Identical font files cached under different URLs share a single buffer.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import Optional
 
 
+DEFAULT_MAX_ENTRIES = 128
+
+
 class FontCache:
-    """In-memory cache for storing downloaded font data.
+    """Bounded in-memory LRU cache for storing downloaded font data.
     
     Attributes:
-        _cache: Dictionary mapping font URLs to font bytes.
+        _cache: Ordered mapping of font URLs to font bytes, least recently
+            used first.
+        _digests: Mapping of font URLs to the SHA-256 digest of their data.
+        _blobs: Mapping of SHA-256 digests to the shared font bytes.
+        _refcounts: Number of cached URLs referencing each digest.
+        _max_entries: Maximum number of fonts kept before eviction.
+        _lock: Guards all cache state so one instance can be shared
+            between threads.
     """
     
-    def __init__(self) -> None:
-        """Initialize an empty font cache."""
-        self._cache: dict[str, bytes] = {}
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize an empty font cache.
+        
+        Args:
+            max_entries: Maximum number of fonts to keep (must be positive).
+        
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._digests: dict[str, bytes] = {}
+        self._blobs: dict[bytes, bytes] = {}
+        self._refcounts: dict[bytes, int] = {}
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
     
     def get_font(self, url: str) -> Optional[bytes]:
         """Retrieve font data from cache by URL.
         
+        A hit marks the font as most recently used.
+        
         Args:
             url: The URL of the font to retrieve.
             
         Returns:
             Font data as bytes if found in cache, None otherwise.
         """
-        return self._cache.get(url)
+        with self._lock:
+            font_data = self._cache.get(url)
+            if font_data is not None:
+                self._cache.move_to_end(url)
+            return font_data
     
     def set_font(self, url: str, font_data: bytes) -> None:
         """Store font data in cache.
         
+        If identical data is already cached under another URL, the existing
+        buffer is reused. If the cache is full, the least recently used font
+        is evicted.
+        
         Args:
             url: The URL of the font to cache.
             font_data: The font file data as bytes.
         """
-        self._cache[url] = font_data
+        digest = hashlib.sha256(font_data).digest()
+        
+        with self._lock:
+            self._release(url)
+            
+            font_data = self._blobs.setdefault(digest, font_data)
+            self._refcounts[digest] = self._refcounts.get(digest, 0) + 1
+            self._digests[url] = digest
+            self._cache[url] = font_data
+            
+            while len(self._cache) > self._max_entries:
+                oldest_url = next(iter(self._cache))
+                self._release(oldest_url)
     
     def clear_font(self, url: str) -> None:
         """Remove a font from the cache.
         
         This is useful for error recovery when a cached font fails to load.
         
+        Args:
+            url: The URL of the font to remove from cache.
+        """
+        with self._lock:
+            self._release(url)
+    
+    def _release(self, url: str) -> None:
+        """Drop a URL entry and free its data once no other URL shares it.
+        
+        The caller must hold ``self._lock``.
+        
         Args:
             url: The URL of the font to remove from cache.
         """
         self._cache.pop(url, None)
+        digest = self._digests.pop(url, None)
+        if digest is None:
+            return
+        
+        remaining = self._refcounts[digest] - 1
+        if remaining:
+            self._refcounts[digest] = remaining
+        else:
+            del self._refcounts[digest]
+            del self._blobs[digest]
 
 
 # Global font cache instance